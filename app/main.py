@@ -1,6 +1,9 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 
+import anyio.to_thread
+import httpx
 from fastapi import FastAPI
 
 from config import settings
@@ -24,13 +27,23 @@ def create_app() -> FastAPI:
 
     @app.on_event("startup")
     async def _startup() -> None:  # pragma: no cover - startup hook
+        # 지표/요약 계산을 스레드로 넘기므로 스레드 풀을 넉넉하게 확장
+        # - asyncio.to_thread: 루프 기본 executor
+        # - 동기 Depends(get_service 등): anyio 스레드 리미터(기본 40)
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=settings.worker_threads))
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.worker_threads
+        # 외부 API(가격/뉴스) 호출용 공유 클라이언트: 요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 keep-alive 재사용
+        app.state.http = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
         try:
             await init_db()
         except Exception:
             # DB 미설치 등 서버 기동만 우선 허용
             pass
         if settings.environment != "test":
-            app.state.feedback_task = start_feedback_scheduler(settings, interval_seconds=300)
+            app.state.feedback_task = start_feedback_scheduler(settings, interval_seconds=300, http_client=app.state.http)
 
     @app.on_event("shutdown")
     async def _shutdown() -> None:  # pragma: no cover - shutdown hook
@@ -39,6 +52,9 @@ def create_app() -> FastAPI:
             task.cancel()
             with suppress(asyncio.CancelledError):
                 await task
+        http = getattr(app.state, "http", None)
+        if http:
+            await http.aclose()
 
     return app
 
@@ -11,9 +11,8 @@ from rich.layout import Layout
 from rich import box
 from datetime import datetime, timedelta
 import subprocess
-import json
 from pathlib import Path
-from cli.visualization import BacktestVisualizer
+from cli.results import load_result_file, recent_result_files
 
 console = Console()
 
@@ -212,18 +211,15 @@ class BacktestUI:
             console.print("[yellow]아직 실행된 백테스트가 없습니다.[/yellow]")
             return
 
-        # JSON 결과 파일 찾기
-        result_files = list(results_dir.glob("backtest_*.json"))
+        # JSON 결과 파일 찾기 (최근 파일부터, 10개만)
+        result_files = recent_result_files(results_dir, limit=10)
 
         if not result_files:
             console.print("[yellow]저장된 결과가 없습니다.[/yellow]")
             return
 
-        # 최근 파일부터 정렬
-        result_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
         # 파일 선택
-        choices = [f.name for f in result_files[:10]]  # 최근 10개만
+        choices = [f.name for f in result_files]
         choices.append("← 뒤로가기")
 
         selected = questionary.select(
@@ -353,9 +349,9 @@ class BacktestUI:
 
                 # 결과 파일 찾기
                 results_dir = Path("results")
-                result_files = list(results_dir.glob(f"backtest_{config['ticker']}_*.json"))
+                result_files = recent_result_files(results_dir, prefix=f"backtest_{config['ticker']}_", limit=1)
                 if result_files:
-                    latest = max(result_files, key=lambda x: x.stat().st_mtime)
+                    latest = result_files[0]
                     console.print(f"\n결과 파일: [cyan]{latest}[/cyan]")
 
                     if questionary.confirm("결과를 표시하시겠습니까?", default=True, style=custom_style).ask():
@@ -369,8 +365,7 @@ class BacktestUI:
     def _display_result(self, result_path: Path):
         """결과 표시"""
         try:
-            with open(result_path, 'r', encoding='utf-8') as f:
-                result = json.load(f)
+            result = load_result_file(result_path)
 
             console.print(Panel(
                 f"[bold cyan]백테스트 결과: {result_path.name}[/bold cyan]",
@@ -432,19 +427,25 @@ class BacktestUI:
             # 차트 표시 옵션
             console.print()
             if questionary.confirm("📊 차트를 생성하시겠습니까?", default=True, style=custom_style).ask():
-                self._show_charts(result_path)
+                self._show_charts(result_path, result)
 
         except Exception as e:
             console.print(f"[red]결과 파일을 읽을 수 없습니다: {e}[/red]")
 
-    def _show_charts(self, result_path: Path):
+    def _show_charts(self, result_path: Path, result: dict):
         """차트 생성 및 표시 (루프로 여러 차트 선택 가능)"""
         try:
-            visualizer = BacktestVisualizer()
-            result = visualizer.load_result(result_path)
+            # matplotlib 로딩(~1s)은 차트를 실제로 만들 때만 부담하도록 지연 import
+            from cli.visualization import PREVIEW_DPI, BacktestVisualizer
+
+            # 기본은 300 DPI 저장. 빠른 미리보기는 명시적으로 선택한 경우에만, 별도 파일명(_preview)으로 저장
+            preview = questionary.confirm(
+                "빠른 미리보기(저해상도)로 생성하시겠습니까?", default=False, style=custom_style
+            ).ask()
+            visualizer = BacktestVisualizer(dpi=PREVIEW_DPI) if preview else BacktestVisualizer()
 
             # 차트 저장 경로
-            base_name = result_path.stem
+            base_name = f"{result_path.stem}_preview" if preview else result_path.stem
             output_dir = result_path.parent / 'charts'
             output_dir.mkdir(exist_ok=True)
 
@@ -13,9 +13,10 @@ from rich import box
 from rich.text import Text
 import redis
 import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config import settings
+from cli.results import load_result_summary, recent_result_files
 
 console = Console()
 
@@ -98,20 +99,21 @@ class Dashboard:
             table.add_row("결과 없음", "", "", "")
             return table
 
-        result_files = list(results_dir.glob("backtest_*.json"))
+        # 최근 5개만
+        recent_files = recent_result_files(results_dir, limit=5)
 
-        if not result_files:
+        if not recent_files:
             table.add_row("결과 없음", "", "", "")
             return table
 
-        # 최근 5개만
-        result_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        # 파일 읽기/파싱은 서로 독립적이므로 스레드로 동시에 로드
+        with ThreadPoolExecutor(max_workers=len(recent_files)) as pool:
+            loaded = list(pool.map(self._load_result, recent_files))
 
-        for result_file in result_files[:5]:
+        for result_file, result in zip(recent_files, loaded):
+            if result is None:
+                continue
             try:
-                with open(result_file, 'r', encoding='utf-8') as f:
-                    result = json.load(f)
-
                 metrics = result.get("metrics", {})
                 config = result.get("config", {})
 
@@ -139,6 +141,14 @@ class Dashboard:
 
         return table
 
+    @staticmethod
+    def _load_result(result_file: Path):
+        """결과 JSON 로드 (실패 시 None) - 요약 표시만 하므로 trades는 제외"""
+        try:
+            return load_result_summary(result_file)
+        except Exception:
+            return None
+
     def show(self):
         """대시보드 표시"""
         console.clear()
@@ -0,0 +1,57 @@
+"""백테스트 결과 파일 탐색 유틸"""
+
+import copy
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+
+def recent_result_files(results_dir: Path, prefix: str = "backtest_", limit: Optional[int] = None) -> List[Path]:
+    """
+    results 디렉터리에서 `{prefix}*.json` 결과 파일을 최근 수정 순으로 반환합니다.
+    os.scandir로 한 번 순회하며 이름으로 먼저 거른 뒤, 남은 항목만 stat해 정렬합니다.
+    """
+    try:
+        with os.scandir(results_dir) as it:
+            entries = [
+                e for e in it
+                if e.name.startswith(prefix) and e.name.endswith(".json") and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [Path(e.path) for e in entries[:limit]]
+
+
+def load_result_file(path: Path) -> Dict[str, Any]:
+    """결과 JSON 로드 (orjson). 호출마다 새로 파싱한 dict를 반환합니다."""
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # 이전 버전(json.dump)이 bare NaN/Infinity로 저장한 결과 파일 호환
+        return json.loads(data)
+
+
+def load_result_summary(path: Path) -> Dict[str, Any]:
+    """
+    trades를 제외한 결과 JSON 로드 (요약 표시용).
+    (경로, 수정 시각, 크기)가 같으면 캐시된 요약을 재사용하며, 호출자가 수정해도 캐시에 영향이 없도록 복사본을 반환합니다.
+    """
+    st = os.stat(path)
+    return copy.deepcopy(_load_summary_cached(os.fspath(path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=8)
+def _load_summary_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns/size는 캐시 키 용도 - 파일이 다시 쓰이면 키가 바뀌어 새로 파싱
+    # trades는 캐시에 남기지 않아 파싱 직후 해제됨
+    result = load_result_file(Path(path))
+    result.pop("trades", None)
+    return result
@@ -1,8 +1,7 @@
 """백테스팅 결과 시각화 모듈"""
 
-import json
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import os
 import warnings
 
@@ -16,12 +15,54 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime
 import numpy as np
+import pandas as pd
+
+from cli.results import load_result_file
+
+# 차트에서 사용하는 trade 필드 (memories 등 중첩 필드는 DataFrame으로 만들지 않음)
+_TRADE_COLUMNS = ['ts', 'action', 'price', 'equity']
+
+# 라인 차트에 그릴 최대 포인트 수 (이보다 많으면 LTTB로 다운샘플링)
+MAX_PLOT_POINTS = 5000
+
+# 대화형 미리보기용 저장 해상도 (기본 300 DPI 대비 래스터화 비용 약 1/6)
+PREVIEW_DPI = 120
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링 - 유지할 포인트의 인덱스를 반환합니다.
+    첫/마지막 포인트는 항상 유지하고, 각 버킷에서 삼각형 면적이 가장 큰 포인트를 골라 선의 형태를 근사합니다.
+    (버킷 안의 극값이 항상 선택되는 것은 아닙니다)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
 
 
 class BacktestVisualizer:
     """백테스팅 결과를 시각화하는 클래스"""
 
-    def __init__(self):
+    def __init__(self, dpi: int = 300):
+        # 저장 해상도 (래스터화 비용이 dpi²에 비례하므로 미리보기용은 낮게 지정)
+        self.dpi = dpi
+        # 같은 결과로 여러 차트를 그릴 때 trades 파싱(타임스탬프 변환)을 한 번만 하도록 캐시
+        self._frames: Dict[int, Tuple[List[Dict[str, Any]], pd.DataFrame]] = {}
+
         # logging 완전히 끄기
         import logging
         logging.getLogger('matplotlib').setLevel(logging.CRITICAL)
@@ -65,9 +106,42 @@ class BacktestVisualizer:
                 pass  # 스타일 없으면 기본 사용
 
     def load_result(self, json_path: Path) -> Dict[str, Any]:
-        """JSON 결과 파일 로드"""
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """JSON 결과 파일 로드 (trades는 로드 시점에 DataFrame으로 파싱해 캐시)"""
+        result = load_result_file(json_path)
+        if result.get('trades'):
+            self._trade_frame(result['trades'])
+        return result
+
+    def _trade_frame(self, trades: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build one trades DataFrame, parsing all timestamps in a single vectorized call (cached per trades list)"""
+        cached = self._frames.get(id(trades))
+        if cached is not None and cached[0] is trades:
+            return cached[1]
+
+        frame = pd.DataFrame.from_records(trades, columns=_TRADE_COLUMNS)
+        frame['ts'] = pd.to_datetime(frame['ts'], format='%Y-%m-%d %H:%M:%S')
+        # 원본 리스트 참조를 함께 보관해 id 재사용으로 잘못된 캐시가 반환되지 않도록 함
+        self._frames[id(trades)] = (trades, frame)
+        return frame
+
+    @staticmethod
+    def _downsample(timestamps: pd.Series, values) -> np.ndarray:
+        """Indices of the points to draw for a dense line (LTTB, at most MAX_PLOT_POINTS)"""
+        x = timestamps.to_numpy().astype('int64').astype(float)
+        return _lttb_indices(x, np.asarray(values, dtype=float), MAX_PLOT_POINTS)
+
+    @staticmethod
+    def _split_signals(timestamps: List[datetime], prices: List[float], actions: List[str]):
+        """Split buy/sell points in a single pass over the trades"""
+        buy_times, buy_prices, sell_times, sell_prices = [], [], [], []
+        for ts, price, action in zip(timestamps, prices, actions):
+            if 'BUY' in action:
+                buy_times.append(ts)
+                buy_prices.append(price)
+            if 'SELL' in action:
+                sell_times.append(ts)
+                sell_prices.append(price)
+        return buy_times, buy_prices, sell_times, sell_prices
 
     def plot_equity_curve(self, result: Dict[str, Any], save_path: Path = None):
         """Equity Curve Chart"""
@@ -77,10 +151,14 @@ class BacktestVisualizer:
             return
 
         # Extract data
-        timestamps = [datetime.strptime(t['ts'], '%Y-%m-%d %H:%M:%S') for t in trades]
-        equity_values = [t['equity'] for t in trades]
+        frame = self._trade_frame(trades)
+        timestamps = frame['ts']
+        equity_values = frame['equity'].to_numpy()
         initial_capital = result['summary']['initial_capital']
 
+        keep = self._downsample(timestamps, equity_values)
+        timestamps, equity_values = timestamps.iloc[keep], equity_values[keep]
+
         # Create chart
         fig, ax = plt.subplots(figsize=(14, 6))
 
@@ -89,10 +167,10 @@ class BacktestVisualizer:
 
         # Fill profit/loss zones
         ax.fill_between(timestamps, equity_values, initial_capital,
-                        where=np.array(equity_values) >= initial_capital,
+                        where=equity_values >= initial_capital,
                         alpha=0.3, color='green', label='Profit Zone')
         ax.fill_between(timestamps, equity_values, initial_capital,
-                        where=np.array(equity_values) < initial_capital,
+                        where=equity_values < initial_capital,
                         alpha=0.3, color='red', label='Loss Zone')
 
         # Labels and title
@@ -114,12 +192,12 @@ class BacktestVisualizer:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
             print(f"Chart saved: {save_path}")
         else:
             plt.show()
 
-        plt.close()
+        plt.close(fig)
 
     def plot_trades_on_price(self, result: Dict[str, Any], save_path: Path = None):
         """Price Chart with Buy/Sell Signals"""
@@ -129,21 +207,20 @@ class BacktestVisualizer:
             return
 
         # Extract data
-        timestamps = [datetime.strptime(t['ts'], '%Y-%m-%d %H:%M:%S') for t in trades]
-        prices = [t['price'] for t in trades]
-        actions = [t['action'] for t in trades]
+        frame = self._trade_frame(trades)
+        timestamps = frame['ts']
+        prices = frame['price']
+        actions = frame['action']
 
         # Separate buy/sell points
-        buy_times = [timestamps[i] for i, a in enumerate(actions) if 'BUY' in a]
-        buy_prices = [prices[i] for i, a in enumerate(actions) if 'BUY' in a]
-        sell_times = [timestamps[i] for i, a in enumerate(actions) if 'SELL' in a]
-        sell_prices = [prices[i] for i, a in enumerate(actions) if 'SELL' in a]
+        buy_times, buy_prices, sell_times, sell_prices = self._split_signals(timestamps, prices, actions)
 
         # Create chart
         fig, ax = plt.subplots(figsize=(14, 6))
 
         # Price line
-        ax.plot(timestamps, prices, linewidth=2, color='#333333', label='Price', zorder=1)
+        keep = self._downsample(timestamps, prices)
+        ax.plot(timestamps.iloc[keep], prices.iloc[keep], linewidth=2, color='#333333', label='Price', zorder=1)
 
         # Buy/Sell markers
         if buy_times:
@@ -171,12 +248,12 @@ class BacktestVisualizer:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
             print(f"Chart saved: {save_path}")
         else:
             plt.show()
 
-        plt.close()
+        plt.close(fig)
 
     def plot_drawdown(self, result: Dict[str, Any], save_path: Path = None):
         """Drawdown Chart - shows portfolio decline from peak"""
@@ -186,33 +263,30 @@ class BacktestVisualizer:
             return
 
         # Extract data
-        timestamps = [datetime.strptime(t['ts'], '%Y-%m-%d %H:%M:%S') for t in trades]
-        equity_values = [t['equity'] for t in trades]
-
-        # Calculate drawdown
-        drawdowns = []
-        peak = equity_values[0]
+        frame = self._trade_frame(trades)
+        timestamps = frame['ts']
+        equity_values = frame['equity'].to_numpy()
 
-        for equity in equity_values:
-            if equity > peak:
-                peak = equity
-            drawdown = ((equity - peak) / peak) * 100  # Percentage from peak
-            drawdowns.append(drawdown)
+        # Calculate drawdown (percentage from running peak)
+        peaks = np.maximum.accumulate(equity_values)
+        drawdowns = (equity_values - peaks) / peaks * 100
 
         # Create chart
         fig, ax = plt.subplots(figsize=(14, 6))
 
         # Plot drawdown as area chart
-        ax.fill_between(timestamps, drawdowns, 0,
-                        where=np.array(drawdowns) <= 0,
+        keep = self._downsample(timestamps, drawdowns)
+        line_times, line_drawdowns = timestamps.iloc[keep], drawdowns[keep]
+        ax.fill_between(line_times, line_drawdowns, 0,
+                        where=line_drawdowns <= 0,
                         color='red', alpha=0.3, label='Drawdown')
-        ax.plot(timestamps, drawdowns, linewidth=2, color='darkred', label='Drawdown %')
+        ax.plot(line_times, line_drawdowns, linewidth=2, color='darkred', label='Drawdown %')
         ax.axhline(y=0, color='gray', linestyle='-', linewidth=1, alpha=0.5)
 
         # Mark maximum drawdown
         max_dd_idx = np.argmin(drawdowns)
         max_dd = drawdowns[max_dd_idx]
-        max_dd_time = timestamps[max_dd_idx]
+        max_dd_time = timestamps.iloc[max_dd_idx]
 
         ax.scatter([max_dd_time], [max_dd], color='darkred', s=150,
                   zorder=5, marker='v', edgecolors='black', linewidth=2,
@@ -236,12 +310,12 @@ class BacktestVisualizer:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
             print(f"Chart saved: {save_path}")
         else:
             plt.show()
 
-        plt.close()
+        plt.close(fig)
 
     def plot_combined_dashboard(self, result: Dict[str, Any], save_path: Path = None):
         """Combined Dashboard (2 charts in one)"""
@@ -251,17 +325,15 @@ class BacktestVisualizer:
             return
 
         # Prepare data
-        timestamps = [datetime.strptime(t['ts'], '%Y-%m-%d %H:%M:%S') for t in trades]
-        equity_values = [t['equity'] for t in trades]
-        prices = [t['price'] for t in trades]
-        actions = [t['action'] for t in trades]
+        frame = self._trade_frame(trades)
+        timestamps = frame['ts']
+        equity_values = frame['equity'].to_numpy()
+        prices = frame['price']
+        actions = frame['action']
         initial_capital = result['summary']['initial_capital']
 
         # Separate buy/sell points
-        buy_times = [timestamps[i] for i, a in enumerate(actions) if 'BUY' in a]
-        buy_prices = [prices[i] for i, a in enumerate(actions) if 'BUY' in a]
-        sell_times = [timestamps[i] for i, a in enumerate(actions) if 'SELL' in a]
-        sell_prices = [prices[i] for i, a in enumerate(actions) if 'SELL' in a]
+        buy_times, buy_prices, sell_times, sell_prices = self._split_signals(timestamps, prices, actions)
 
         # Create 2 subplots
         fig = plt.figure(figsize=(16, 9))
@@ -278,13 +350,15 @@ class BacktestVisualizer:
 
         # 1. Equity Curve
         ax1 = plt.subplot(2, 1, 1)
-        ax1.plot(timestamps, equity_values, linewidth=2, color='#2E86AB', label='Equity')
+        keep = self._downsample(timestamps, equity_values)
+        eq_times, eq_values = timestamps.iloc[keep], equity_values[keep]
+        ax1.plot(eq_times, eq_values, linewidth=2, color='#2E86AB', label='Equity')
         ax1.axhline(y=initial_capital, color='gray', linestyle='--', linewidth=1, alpha=0.7)
-        ax1.fill_between(timestamps, equity_values, initial_capital,
-                        where=np.array(equity_values) >= initial_capital,
+        ax1.fill_between(eq_times, eq_values, initial_capital,
+                        where=eq_values >= initial_capital,
                         alpha=0.3, color='green')
-        ax1.fill_between(timestamps, equity_values, initial_capital,
-                        where=np.array(equity_values) < initial_capital,
+        ax1.fill_between(eq_times, eq_values, initial_capital,
+                        where=eq_values < initial_capital,
                         alpha=0.3, color='red')
         ax1.set_ylabel('Equity ($)', fontsize=12)
         ax1.set_title('Equity Curve', fontsize=13, fontweight='bold', pad=12)
@@ -295,7 +369,8 @@ class BacktestVisualizer:
 
         # 2. Price & Trade Signals
         ax2 = plt.subplot(2, 1, 2)
-        ax2.plot(timestamps, prices, linewidth=2, color='#333333', label='Price', zorder=1)
+        keep = self._downsample(timestamps, prices)
+        ax2.plot(timestamps.iloc[keep], prices.iloc[keep], linewidth=2, color='#333333', label='Price', zorder=1)
         if buy_times:
             ax2.scatter(buy_times, buy_prices, color='green', marker='^', s=100,
                        label='Buy', zorder=3, edgecolors='darkgreen', linewidth=1.5)
@@ -313,12 +388,12 @@ class BacktestVisualizer:
         plt.tight_layout(rect=[0, 0, 1, 0.95])
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
             print(f"Dashboard saved: {save_path}")
         else:
             plt.show()
 
-        plt.close()
+        plt.close(fig)
 
     def generate_all_charts(self, json_path: Path):
         """Generate and save all charts"""
@@ -42,6 +42,8 @@ class Settings(BaseSettings):
     memory_rollup_count: int = Field(default=50, alias="MEMORY_ROLLUP_COUNT")  # rollup after N manager reports
     memory_rollup_target: int = Field(default=10, alias="MEMORY_ROLLUP_TARGET")  # keep top N after rollup
     memory_gc_batch: int = Field(default=50, alias="MEMORY_GC_BATCH")  # delete this many expired manager reports at rollup
+    memory_query_cache_size: int = Field(default=0, alias="MEMORY_QUERY_CACHE_SIZE")  # cached search results (0 = off)
+    memory_query_cache_ttl: float = Field(default=300.0, alias="MEMORY_QUERY_CACHE_TTL")  # seconds
     price_cache_ttl: float = Field(default=120.0, alias="PRICE_CACHE_TTL")
     news_cache_ttl: float = Field(default=300.0, alias="NEWS_CACHE_TTL")
     max_rounds: int = Field(default=1, alias="DEBATE_MAX_ROUNDS")
@@ -58,6 +60,7 @@ class Settings(BaseSettings):
     backtest_stop_loss: float = Field(default=-0.05, alias="BACKTEST_STOP_LOSS")  # -5%
     backtest_take_profit: float = Field(default=0.1, alias="BACKTEST_TAKE_PROFIT")  # +10%
     feedback_check_days: int = Field(default=7, alias="FEEDBACK_CHECK_DAYS")  # N일 후 결과 확인
+    worker_threads: int = Field(default=100, alias="WORKER_THREADS")  # asyncio.to_thread/anyio 스레드 풀 크기
 
     @computed_field
     @property
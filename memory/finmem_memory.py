@@ -9,6 +9,7 @@ try:
     from langchain_redis import RedisVectorStore
 except (ImportError, ModuleNotFoundError):
     from langchain_community.vectorstores import Redis as RedisVectorStore
+from memory.query_cache import QueryCache
 from services.llm import BaseLLMClient
 
 
@@ -32,6 +33,8 @@ class FinMemMemory:
         expected_dim: int = 768,
         logger: Optional[logging.Logger] = None,
         gc_batch: int = 50,
+        query_cache_size: int = 0,
+        query_cache_ttl: float = 300.0,
     ):
         self.store = store
         self.recency_lambda = recency_lambda
@@ -49,6 +52,9 @@ class FinMemMemory:
         self.gc_batch = gc_batch
         self.logger = logger or logging.getLogger(__name__)
         self.expected_dim = expected_dim
+        # 동일 쿼리의 반복 검색 결과 캐시 (기본 비활성). 이 인스턴스의 add/delete만 무효화하므로
+        # 다른 프로세스/인스턴스의 쓰기는 TTL 동안 반영되지 않음. 스텝마다 add_memory하는 백테스트에서는 적중하지 않음
+        self._query_cache = QueryCache(max_size=query_cache_size, ttl=query_cache_ttl)
         self._check_index_dimension()
 
     async def search(
@@ -59,10 +65,7 @@ class FinMemMemory:
         ticker: Optional[str] = None,
         roles: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        try:
-            docs_scores = self.store.similarity_search_with_score(query, k=k * 3)
-        except Exception:
-            docs_scores = []
+        docs_scores = self._cached_search(query, k * 3)
         results: List[Tuple[Dict[str, Any], float]] = []
         now = time.time()
         for doc, sim in docs_scores:
@@ -80,11 +83,28 @@ class FinMemMemory:
             score = sim * role_weight - self.recency_lambda * age_days + self.salience_weight * float(sal)
             if score < self.score_cutoff:
                 continue
-            results.append(({"content": doc.page_content, "metadata": md}, score))
+            # 캐시된 문서의 metadata를 호출자가 수정하지 않도록 복사본 반환
+            results.append(({"content": doc.page_content, "metadata": dict(md)}, score))
 
         results.sort(key=lambda x: x[1], reverse=True)
         return [r[0] for r in results[:k]]
 
+    def _cached_search(self, query: str, k: int) -> List[Tuple[Any, float]]:
+        """
+        similarity_search_with_score 결과를 (query, k) 키로 캐시.
+        나이/가중치 점수는 search()에서 매번 다시 계산하므로 원본 (문서, 유사도)만 보관한다.
+        """
+        key = (query, k)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            docs_scores = self.store.similarity_search_with_score(query, k=k)
+        except Exception:
+            return []
+        self._query_cache.set(key, docs_scores)
+        return docs_scores
+
     async def add_memory(self, content: str, metadata: Dict[str, Any]) -> str:
         if self.skip_stub and self.is_stub_embedding:
             if self.logger:
@@ -98,6 +118,7 @@ class FinMemMemory:
             return "deduped"
         memory_id = str(uuid4())
         self.store.add_texts([content], metadatas=[metadata], ids=[memory_id])
+        self._query_cache.clear()
         # 롤업 조건: manager 리포트가 rollup_count 배수일 때 요약
         if metadata.get("role") == "manager" and self.llm:
             try:
@@ -181,5 +202,6 @@ class FinMemMemory:
                     expired_ids.append(md["id"])
             if expired_ids:
                 self.store.delete(expired_ids)
+                self._query_cache.clear()
         except Exception:
             pass
@@ -1,7 +1,7 @@
 from typing import Any, List
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field, ConfigDict
 import httpx
 
@@ -79,8 +79,8 @@ class PointBacktestResponse(BaseModel):
     trades: List[BacktestTrade]
 
 
-def get_service(settings: Settings = Depends(get_settings)) -> BacktestService:
-    sim_service = SimulationService(settings)
+def get_service(request: Request, settings: Settings = Depends(get_settings)) -> BacktestService:
+    sim_service = SimulationService(settings, http_client=getattr(request.app.state, "http", None))
     return BacktestService(sim_service, settings)
 
 
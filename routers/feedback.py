@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import Optional
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 from config import Settings, get_settings
 from services.simulation import SimulationService
@@ -10,8 +10,8 @@ from services.simulation import SimulationService
 router = APIRouter(prefix="/api/feedback", tags=["feedback"])
 
 
-def get_service(settings: Settings = Depends(get_settings)) -> SimulationService:
-    return SimulationService(settings)
+def get_service(request: Request, settings: Settings = Depends(get_settings)) -> SimulationService:
+    return SimulationService(settings, http_client=getattr(request.app.state, "http", None))
 
 
 @router.post("/check")
@@ -3,7 +3,7 @@ from datetime import datetime
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 import httpx
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -98,8 +98,8 @@ class SimulationResponse(BaseModel):
     summary: dict[str, Any] | None = Field(default=None, description="Simulation summary payload")
 
 
-def get_service(settings: Settings = Depends(get_settings)) -> SimulationService:
-    return SimulationService(settings)
+def get_service(request: Request, settings: Settings = Depends(get_settings)) -> SimulationService:
+    return SimulationService(settings, http_client=getattr(request.app.state, "http", None))
 
 
 @router.post("/run", response_model=SimulationResponse)
@@ -6,94 +6,186 @@ Redis 메모리 상태 확인 스크립트
 사용예:
     python scripts/check_memory.py
     python scripts/check_memory.py --ticker AAPL
+    python scripts/check_memory.py --verbose   # 샘플 벡터 검색(k=5) 결과까지 출력
 """
+import argparse
 import asyncio
+import re
 import sys
+from collections import Counter
 from pathlib import Path
 
 # 프로젝트 루트를 Python path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import settings
-from services.llm import build_embeddings
-from memory.redis_store import build_vector_store
+
+
+def _tag_fields(index_info: dict) -> set:
+    """FT.INFO attributes에서 TAG 타입으로 인덱싱된 필드 이름을 추출"""
+    fields = set()
+    for attr in index_info.get("attributes") or []:
+        props = attr if isinstance(attr, dict) else dict(zip(attr[::2], attr[1::2]))
+        if str(props.get("type", "")).upper() == "TAG":
+            fields.add(props.get("attribute") or props.get("identifier"))
+    return fields
+
+
+def _escape_tag(value: str) -> str:
+    """TAG 쿼리 값의 특수문자 이스케이프 (예: BRK.B -> BRK\\.B)"""
+    return re.sub(r"(\W)", r"\\\1", value)
+
+
+async def _count_docs(r, query: str) -> int:
+    """FT.SEARCH LIMIT 0 0 - 문서 본문 없이 매칭 개수만 반환"""
+    reply = await r.execute_command("FT.SEARCH", settings.redis_index, query, "LIMIT", "0", "0")
+    return int(reply[0])
+
+
+async def _role_counts(r, query: str) -> Counter:
+    """FT.AGGREGATE GROUPBY @role - Role별 개수를 서버에서 집계 (응답 크기는 문서 수가 아닌 Role 수에 비례)"""
+    reply = await r.execute_command(
+        "FT.AGGREGATE", settings.redis_index, query,
+        "LOAD", "1", "@role",  # role이 스키마에 없어도 해시 필드에서 읽도록
+        "GROUPBY", "1", "@role", "REDUCE", "COUNT", "0", "AS", "cnt",
+        "SORTBY", "2", "@cnt", "DESC",
+    )
+    roles = Counter()
+    for row in reply[1:]:
+        props = dict(zip(row[::2], row[1::2]))
+        roles[props.get("role") or "unknown"] += int(props.get("cnt", 0))
+    return roles
+
+
+# 모듈 수준 파서 - -h는 redis/LangChain import 없이 바로 응답
+parser = argparse.ArgumentParser(description="Redis 메모리 상태 확인")
+parser.add_argument("--ticker", type=str, help="특정 ticker 필터")
+parser.add_argument("--verbose", action="store_true", help="샘플 벡터 검색 결과 출력")
 
 
 async def main():
-    import argparse
-    parser = argparse.ArgumentParser(description="Redis 메모리 상태 확인")
-    parser.add_argument("--ticker", type=str, help="특정 ticker 필터")
     args = parser.parse_args()
 
     print("=" * 80)
     print("📊 Redis 메모리 상태 확인")
     print("=" * 80)
 
+    r = None
     try:
-        import redis
+        # 비동기 클라이언트 - main()이 asyncio.run으로 실행되므로 이벤트 루프를 블로킹하지 않음
+        # (memory.redis_store는 LangChain까지 불러오므로 기본 경로에서는 redis만 직접 사용)
+        import redis.asyncio as redis
         r = redis.from_url(settings.redis_url, decode_responses=True)
-        r.ping()
+        await r.ping()
         print("✅ Redis 연결 성공\n")
 
         # 전체 키 개수
-        total_keys = r.dbsize()
+        total_keys = await r.dbsize()
         print(f"📦 전체 Redis 키 개수: {total_keys}")
 
+        # 빈 DB면 키 순회/임베딩 모델 로드/벡터 스토어 연결을 할 필요가 없음
+        if total_keys == 0:
+            print("\n" + "=" * 80)
+            print("💡 메모리 상태 해석:")
+            print("=" * 80)
+            print("⚠️  메모리가 완전히 비어있습니다.")
+            print("   → 백테스트를 한 번도 실행하지 않았거나 최근에 초기화했습니다.")
+            return
+
         # 메모리 키 검색
         if args.ticker:
             pattern = f"*{args.ticker}*"
         else:
             pattern = "*"
 
-        keys = r.keys(pattern)
-        print(f"🔍 패턴 '{pattern}' 매칭: {len(keys)}개 키")
+        # KEYS는 O(N)으로 Redis를 블로킹하므로 SCAN으로 순회하며 개수와 샘플만 유지
+        # 전체 패턴이면 개수는 DBSIZE(O(1))와 같으므로 샘플 10개만 받고 순회를 멈춤
+        matched = total_keys if pattern == "*" else 0
+        sample_keys = []
+        async for key in r.scan_iter(match=pattern, count=1000):
+            if pattern == "*":
+                sample_keys.append(key)
+                if len(sample_keys) >= 10:
+                    break
+                continue
+            matched += 1
+            if len(sample_keys) < 10:
+                sample_keys.append(key)
+        print(f"🔍 패턴 '{pattern}' 매칭: {matched}개 키")
 
         # 샘플 출력 (최대 10개)
-        if keys:
+        if sample_keys:
             print("\n📝 샘플 키 (최대 10개):")
-            for key in keys[:10]:
+            for key in sample_keys:
                 print(f"  - {key}")
-            if len(keys) > 10:
-                print(f"  ... 외 {len(keys) - 10}개")
+            if matched > 10:
+                print(f"  ... 외 {matched - 10}개")
 
         # Vector Store 검색 테스트
         print("\n" + "=" * 80)
         print("🔎 Vector Store 검색 테스트")
         print("=" * 80)
 
-        vector_results = []
-        all_results = []
+        stored_total = 0     # 인덱스 전체 문서 수 (FT.INFO num_docs)
+        stored_count = 0     # 조회 대상(전체 또는 ticker) 메모리 수
+        role_counts = None   # ticker 지정 시 Role별 분포
         try:
-            embeddings = build_embeddings(
-                model_name=settings.ollama_embedding_model,
-                base_url=settings.ollama_base_url,
-            )
-            store = build_vector_store(settings, embeddings)
-
-            # 테스트 쿼리
-            query = f"{args.ticker or 'AAPL'} market"
-            print(f"쿼리: '{query}'")
-
-            # 먼저 많은 수를 가져와서 실제 저장된 개수 확인
-            all_results = store.similarity_search_with_score(query, k=1000)
-            vector_results = all_results[:5]  # 샘플 출력용
-
-            print(f"✅ 전체 검색 결과: {len(all_results)}개")
-            print(f"   (샘플 5개만 출력)")
-
-            if vector_results:
-                print("\n📄 검색 결과 샘플:")
-                for i, (doc, score) in enumerate(vector_results[:3], 1):
-                    content = doc.page_content[:100]
-                    metadata = doc.metadata or {}
-                    role = metadata.get("role", "unknown")
-                    ticker = metadata.get("ticker", "N/A")
-                    print(f"\n  [{i}] Score: {score:.4f}")
-                    print(f"      Role: {role}, Ticker: {ticker}")
-                    print(f"      Content: {content}...")
+            # 저장 개수는 인덱스 메타데이터로 확인 - 개수 파악만을 위해 ANN 검색(k=1000)을 돌리지 않음
+            index_info = await r.ft(settings.redis_index).info()
+            stored_total = int(index_info.get("num_docs", 0))
+            tag_fields = _tag_fields(index_info)
+
+            if not args.ticker:
+                stored_count = stored_total
+            elif "ticker" in tag_fields:
+                # FT.SEARCH ... LIMIT 0 0: 문서를 가져오지 않고 매칭 개수만 반환
+                ticker_query = f"@ticker:{{{_escape_tag(args.ticker)}}}"
+                stored_count = await _count_docs(r, ticker_query)
+                role_counts = await _role_counts(r, ticker_query) if stored_count else Counter()
+
+            print(f"✅ 인덱스 문서 수: {stored_total}개")
+
+            # ticker가 TAG로 인덱싱되지 않은 인덱스 - 기존처럼 검색 결과를 클라이언트에서 필터
+            needs_probe = bool(args.ticker) and "ticker" not in tag_fields
+            if not (args.verbose or needs_probe):
+                print("   (샘플 검색 결과는 --verbose로 확인)")
             else:
-                print("⚠️  검색 결과가 없습니다.")
-                print("   → 메모리가 비어있거나 임베딩이 생성되지 않았습니다.")
+                # 임베딩 모델/벡터 스토어는 실제 검색이 필요할 때만 준비
+                from services.llm import build_embeddings
+                from memory.redis_store import build_vector_store
+
+                embeddings = build_embeddings(
+                    model_name=settings.ollama_embedding_model,
+                    base_url=settings.ollama_base_url,
+                )
+                store = build_vector_store(settings, embeddings)
+                query = f"{args.ticker or 'AAPL'} market"
+
+                if needs_probe:
+                    probe = store.similarity_search_with_score(query, k=1000)
+                    ticker_docs = [doc for doc, score in probe if doc.metadata and doc.metadata.get("ticker") == args.ticker]
+                    stored_count = len(ticker_docs)
+                    role_counts = Counter(doc.metadata.get("role", "unknown") for doc in ticker_docs)
+
+                if args.verbose:
+                    # 테스트 쿼리
+                    print(f"쿼리: '{query}'")
+                    print(f"   (샘플 5개만 출력)")
+                    vector_results = store.similarity_search_with_score(query, k=5)
+
+                    if vector_results:
+                        print("\n📄 검색 결과 샘플:")
+                        for i, (doc, score) in enumerate(vector_results[:3], 1):
+                            content = doc.page_content[:100]
+                            metadata = doc.metadata or {}
+                            role = metadata.get("role", "unknown")
+                            ticker = metadata.get("ticker", "N/A")
+                            print(f"\n  [{i}] Score: {score:.4f}")
+                            print(f"      Role: {role}, Ticker: {ticker}")
+                            print(f"      Content: {content}...")
+                    else:
+                        print("⚠️  검색 결과가 없습니다.")
+                        print("   → 메모리가 비어있거나 임베딩이 생성되지 않았습니다.")
 
         except Exception as e:
             print(f"❌ Vector Store 검색 실패: {e}")
@@ -102,32 +194,26 @@ async def main():
         print("💡 메모리 상태 해석:")
         print("=" * 80)
 
-        if total_keys == 0:
-            print("⚠️  메모리가 완전히 비어있습니다.")
-            print("   → 백테스트를 한 번도 실행하지 않았거나 최근에 초기화했습니다.")
-        elif len(all_results) == 0:
+        if stored_total == 0:
             print(f"⚠️  {args.ticker or '전체'} 관련 메모리가 없습니다.")
             print(f"   → 백테스트를 실행해보세요.")
         else:
             # 티커 필터링 확인
             if args.ticker:
-                ticker_matches = [(doc, score) for doc, score in all_results if doc.metadata and doc.metadata.get("ticker") == args.ticker]
-                if ticker_matches:
-                    print(f"✅ {args.ticker} 메모리가 총 {len(ticker_matches)}개 저장되어 있습니다.")
+                if stored_count:
+                    print(f"✅ {args.ticker} 메모리가 총 {stored_count}개 저장되어 있습니다.")
                     print("   → use-memory 실험이 의미 있는 데이터를 사용합니다.")
 
                     # Role별 통계
-                    from collections import Counter
-                    roles = [doc.metadata.get("role", "unknown") for doc, score in ticker_matches if doc.metadata]
-                    role_counts = Counter(roles)
-                    print("\n   📊 Role별 분포:")
-                    for role, count in role_counts.most_common():
-                        print(f"      - {role}: {count}개")
+                    if role_counts:
+                        print("\n   📊 Role별 분포:")
+                        for role, count in role_counts.most_common():
+                            print(f"      - {role}: {count}개")
                 else:
                     print(f"⚠️  {args.ticker} 관련 메모리가 없습니다.")
-                    print(f"   → 검색 결과는 있지만 다른 종목 데이터입니다.")
+                    print(f"   → 저장된 메모리는 있지만 다른 종목 데이터입니다.")
             else:
-                print(f"✅ 메모리가 총 {len(all_results)}개 정상적으로 저장되어 있습니다.")
+                print(f"✅ 메모리가 총 {stored_count}개 정상적으로 저장되어 있습니다.")
                 print("   → use-memory 실험이 의미 있는 데이터를 사용합니다.")
 
     except ImportError:
@@ -135,6 +221,9 @@ async def main():
         print("   설치: uv pip install redis")
     except Exception as e:
         print(f"❌ 실패: {e}")
+    finally:
+        if r is not None:
+            await r.aclose()
 
 
 if __name__ == "__main__":
@@ -27,26 +27,52 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import settings
 
+_db = None  # (engine, session factory) - 처음 PostgreSQL을 쓸 때 생성
+
+
+def _get_db():
+    """
+    스크립트 전용 엔진/세션 팩토리를 한 번만 만들어 확인/초기화 단계가 공유.
+    앱 엔진(db.session)의 풀 설정과 분리하며, 동시에 쓰는 연결은 최대 2개(확인 + 초기화)라 작은 풀로 충분.
+    """
+    global _db
+    if _db is None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+        engine = create_async_engine(settings.db_url, pool_size=2, max_overflow=0)
+        _db = (engine, async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False))
+    return _db
+
 
 async def reset_redis(ticker: str = None, auto_confirm: bool = False):
     """Redis 메모리 초기화"""
+    r = None
     try:
-        import redis
-        from redis.commands.search.index_definition import IndexDefinition, IndexType
+        import redis.asyncio as redis
 
         print("\n📦 Redis 연결 중...")
+        # 비동기 클라이언트 - 동기 호출로 이벤트 루프를 블로킹하지 않도록 redis.asyncio 사용
         r = redis.from_url(settings.redis_url, decode_responses=True)
 
         # Redis 연결 확인
-        r.ping()
+        await r.ping()
         print(f"✅ Redis 연결 성공: {settings.redis_url}")
 
         if ticker:
             # 특정 ticker의 키만 삭제
             pattern = f"*{ticker}*"
-            keys = r.keys(pattern)
-            if keys:
-                deleted = r.delete(*keys)
+            # KEYS + DELETE(*keys) 대신 SCAN으로 순회하며 500개 단위로 UNLINK (메모리 해제는 서버 백그라운드 처리)
+            deleted = 0
+            batch = []
+            async for key in r.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await r.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await r.unlink(*batch)
+
+            if deleted:
                 print(f"✅ {ticker} 관련 키 {deleted}개 삭제됨")
             else:
                 print(f"⚠️  {ticker} 관련 키가 없습니다")
@@ -59,15 +85,15 @@ async def reset_redis(ticker: str = None, auto_confirm: bool = False):
                     print("❌ 취소됨")
                     return
 
-            # FT.DROPINDEX로 인덱스 삭제
+            # FT.DROPINDEX로 인덱스 정의만 삭제 (문서는 바로 아래 FLUSHDB가 지우므로 DD로 중복 삭제하지 않음)
             try:
-                r.execute_command(f"FT.DROPINDEX {settings.redis_index} DD")
+                await r.execute_command("FT.DROPINDEX", settings.redis_index)
                 print(f"✅ 인덱스 '{settings.redis_index}' 삭제됨")
             except Exception as e:
                 print(f"⚠️  인덱스 삭제 실패 (없을 수도 있음): {e}")
 
-            # FLUSHDB로 전체 DB 초기화
-            r.flushdb()
+            # FLUSHDB ASYNC로 전체 DB 초기화 (메모리 해제는 서버 백그라운드 스레드에서 처리)
+            await r.flushdb(asynchronous=True)
             print("✅ Redis DB 초기화 완료")
 
     except ImportError:
@@ -76,15 +102,18 @@ async def reset_redis(ticker: str = None, auto_confirm: bool = False):
     except Exception as e:
         print(f"❌ Redis 초기화 실패: {e}")
         print("   Redis가 실행 중이 아니거나 연결 정보가 잘못되었습니다.")
+    finally:
+        if r is not None:
+            await r.aclose()
 
 
 async def reset_postgres(ticker: str = None, auto_confirm: bool = False):
     """PostgreSQL 시뮬레이션 로그 초기화"""
     try:
-        from db.session import SessionLocal, engine
         from db.models import Base, Simulation, AgentLog, Backtest, BacktestTrade
 
         print("\n🐘 PostgreSQL 연결 중...")
+        engine, SessionLocal = _get_db()
 
         # 테이블 존재 확인
         async with engine.begin() as conn:
@@ -132,33 +161,44 @@ async def reset_postgres(ticker: str = None, auto_confirm: bool = False):
         print("   PostgreSQL이 실행 중이 아니거나 연결 정보가 잘못되었습니다.")
 
 
-async def check_memory_mode():
+async def _probe_redis():
+    import redis.asyncio as redis
+
+    r = redis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        await r.ping()
+    finally:
+        await r.aclose()
+
+
+async def _probe_postgres():
+    engine, _ = _get_db()
+    async with engine.connect():
+        pass
+
+
+async def check_memory_mode(timeout: float = 2.0):
     """현재 메모리 모드 확인"""
     print("\n🔍 메모리 시스템 확인 중...")
 
-    # Redis 확인
-    try:
-        import redis
+    # Redis/PostgreSQL 연결 확인을 동시에 실행 - 응답 없는 서비스는 timeout 후 사용 불가로 처리
+    redis_result, postgres_result = await asyncio.gather(
+        asyncio.wait_for(_probe_redis(), timeout),
+        asyncio.wait_for(_probe_postgres(), timeout),
+        return_exceptions=True,
+    )
 
-        r = redis.from_url(settings.redis_url, decode_responses=True)
-        r.ping()
+    redis_available = not isinstance(redis_result, BaseException)
+    if redis_available:
         print("✅ Redis: 사용 가능 (영구 메모리 모드)")
-        redis_available = True
-    except Exception:
+    else:
         print("❌ Redis: 사용 불가 (InMemory 모드로 작동)")
-        redis_available = False
 
-    # PostgreSQL 확인
-    try:
-        from db.session import engine
-
-        async with engine.connect():
-            pass
+    postgres_available = not isinstance(postgres_result, BaseException)
+    if postgres_available:
         print("✅ PostgreSQL: 사용 가능")
-        postgres_available = True
-    except Exception:
+    else:
         print("❌ PostgreSQL: 사용 불가")
-        postgres_available = False
 
     print("\n📋 현재 설정:")
     print(f"  - REDIS_URL: {settings.redis_url}")
@@ -175,27 +215,37 @@ async def check_memory_mode():
     return redis_available, postgres_available
 
 
-async def main():
-    parser = argparse.ArgumentParser(description="메모리 초기화 스크립트")
+parser = argparse.ArgumentParser(description="메모리 초기화 스크립트")
 
-    # 초기화 대상
-    parser.add_argument("--all", action="store_true", help="Redis + PostgreSQL 모두 초기화")
-    parser.add_argument("--redis", action="store_true", help="Redis만 초기화")
-    parser.add_argument("--postgres", action="store_true", help="PostgreSQL만 초기화")
+# 초기화 대상
+parser.add_argument("--all", action="store_true", help="Redis + PostgreSQL 모두 초기화")
+parser.add_argument("--redis", action="store_true", help="Redis만 초기화")
+parser.add_argument("--postgres", action="store_true", help="PostgreSQL만 초기화")
 
-    # 선택적 필터
-    parser.add_argument("--ticker", type=str, help="특정 ticker만 초기화 (예: AAPL)")
+# 선택적 필터
+parser.add_argument("--ticker", type=str, help="특정 ticker만 초기화 (예: AAPL)")
+
+# 확인 모드
+parser.add_argument("--check", action="store_true", help="현재 메모리 모드만 확인")
+parser.add_argument("--yes", action="store_true", help="자동 확인 (확인 프롬프트 건너뛰기)")
 
-    # 확인 모드
-    parser.add_argument("--check", action="store_true", help="현재 메모리 모드만 확인")
-    parser.add_argument("--yes", action="store_true", help="자동 확인 (확인 프롬프트 건너뛰기)")
 
+async def main():
     args = parser.parse_args()
 
     print("=" * 80)
     print("🔧 메모리 초기화 스크립트")
     print("=" * 80)
 
+    try:
+        await _run(args)
+    finally:
+        # 초기화/확인 단계가 공유한 엔진은 이벤트 루프가 닫히기 전에 한 번만 정리
+        if _db is not None:
+            await _db[0].dispose()
+
+
+async def _run(args):
     # 확인 모드
     if args.check:
         await check_memory_mode()
@@ -211,13 +261,23 @@ async def main():
         parser.print_help()
         sys.exit(1)
 
+    resets = []
+
     # Redis 초기화
     if args.all or args.redis:
-        await reset_redis(ticker=args.ticker, auto_confirm=args.yes)
+        resets.append(reset_redis(ticker=args.ticker, auto_confirm=args.yes))
 
     # PostgreSQL 초기화
     if args.all or args.postgres:
-        await reset_postgres(ticker=args.ticker, auto_confirm=args.yes)
+        resets.append(reset_postgres(ticker=args.ticker, auto_confirm=args.yes))
+
+    if args.yes:
+        # 확인 프롬프트가 없으면 두 저장소 초기화는 서로 독립적이므로 동시에 실행
+        await asyncio.gather(*resets)
+    else:
+        # input() 확인 프롬프트가 섞이지 않도록 순차 실행
+        for reset in resets:
+            await reset
 
     print("\n" + "=" * 80)
     print("✅ 초기화 완료!")
@@ -7,49 +7,87 @@
 """
 import asyncio
 import argparse
-import json
 import sys
 import logging
 from pathlib import Path
 from datetime import datetime
 import csv
+from operator import itemgetter
 
 # 프로젝트 루트를 Python path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import settings
-from services.backtest import BacktestService
-from services.simulation import SimulationService
 
+import orjson
+
+# BacktestService.run()이 기록하는 trade 딕셔너리의 고정 필드 순서 (CSV 컬럼)
+TRADE_FIELDS = (
+    "ts",
+    "action",
+    "price",
+    "trade_shares",
+    "position_shares",
+    "trade_notional",
+    "cash",
+    "equity",
+    "fee",
+    "pnl",
+    "cumulative_pnl",
+    "memories",
+)
+_trade_row = itemgetter(*TRADE_FIELDS)
+
+
+def _dump_json(obj, path: Path) -> None:
+    """결과 JSON 저장 (orjson) - numpy 값은 숫자/리스트로, NaN/Inf는 null로 기록"""
+    # datetime은 default=str로 넘겨 기존 형식("YYYY-MM-DD HH:MM:SS") 유지
+    path.write_bytes(
+        orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS,
+        )
+    )
 
-async def main():
-    parser = argparse.ArgumentParser(description="FinMem Trading 백테스트 실행")
-
-    # 필수 인자
-    parser.add_argument("--ticker", type=str, required=True, help="종목 심볼 (예: AAPL, TSLA)")
-
-    # 백테스트 설정
-    parser.add_argument("--start-date", type=str, default="2025-09-01", help="시작 날짜 (YYYY-MM-DD)")
-    parser.add_argument("--end-date", type=str, default="2025-11-20", help="종료 날짜 (YYYY-MM-DD)")
-    parser.add_argument("--window", type=int, default=30, help="슬라이딩 윈도우 길이 (기본: 30)")
-    parser.add_argument("--step", type=int, default=1, help="스텝 간격 (기본: 1)")
-    parser.add_argument("--interval", type=str, default="1h", help="시간 간격 (예: 1h, 1day)")
-    parser.add_argument("--shares", type=float, default=1.0, help="거래 시 진입/청산 주수 (기본: 1주)")
-    parser.add_argument("--initial-capital", type=float, default=10000.0, help="초기 자본 (기본: 10,000)")
-
-    # 실험 설정
-    parser.add_argument("--seed", type=int, default=42, help="랜덤 시드 (기본: 42)")
-    parser.add_argument("--include-news", action="store_true", default=True, help="뉴스 포함")
-    parser.add_argument("--no-news", action="store_true", help="뉴스 제외")
-    parser.add_argument("--use-memory", action="store_true", default=True, help="메모리 사용")
-    parser.add_argument("--no-memory", action="store_true", help="메모리 미사용")
-
-    # 출력 설정
-    parser.add_argument("--output-dir", type=str, default="results", help="결과 저장 디렉터리")
-    parser.add_argument("--verbose", action="store_true", help="자세한 로그 출력")
 
+# 모듈 수준 파서 - -h/--help는 서비스 모듈을 불러오기 전에 응답
+parser = argparse.ArgumentParser(description="FinMem Trading 백테스트 실행")
+
+# 필수 인자
+parser.add_argument("--ticker", type=str, required=True, help="종목 심볼 (예: AAPL, TSLA)")
+
+# 백테스트 설정
+parser.add_argument("--start-date", type=str, default="2025-09-01", help="시작 날짜 (YYYY-MM-DD)")
+parser.add_argument("--end-date", type=str, default="2025-11-20", help="종료 날짜 (YYYY-MM-DD)")
+parser.add_argument("--window", type=int, default=30, help="슬라이딩 윈도우 길이 (기본: 30)")
+parser.add_argument("--step", type=int, default=1, help="스텝 간격 (기본: 1)")
+parser.add_argument("--interval", type=str, default="1h", help="시간 간격 (예: 1h, 1day)")
+parser.add_argument("--shares", type=float, default=1.0, help="거래 시 진입/청산 주수 (기본: 1주)")
+parser.add_argument("--initial-capital", type=float, default=10000.0, help="초기 자본 (기본: 10,000)")
+
+# 실험 설정
+parser.add_argument("--seed", type=int, default=42, help="랜덤 시드 (기본: 42)")
+parser.add_argument("--include-news", action="store_true", default=True, help="뉴스 포함")
+parser.add_argument("--no-news", action="store_true", help="뉴스 제외")
+parser.add_argument("--use-memory", action="store_true", default=True, help="메모리 사용")
+parser.add_argument("--no-memory", action="store_true", help="메모리 미사용")
+
+# 출력 설정
+parser.add_argument("--output-dir", type=str, default="results", help="결과 저장 디렉터리")
+parser.add_argument("--verbose", action="store_true", help="자세한 로그 출력")
+
+
+async def main():
     args = parser.parse_args()
 
+    # 서비스 모듈(LangChain/Redis/SQLAlchemy)은 인자 파싱 이후에 로드
+    from services.backtest import BacktestService
+    from services.simulation import SimulationService
+
     # 로깅 설정 - 거래 로그만 표시
     if args.verbose:
         logging.basicConfig(
@@ -139,39 +177,36 @@ async def main():
 
         # 1. JSON 저장(전체 결과)
         json_path = output_dir / f"{prefix}.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "ticker": args.ticker,
-                    "start_date": args.start_date,
-                    "end_date": args.end_date,
-                    "seed": args.seed,
-                    "summary": metrics,
-                    "trades": result.trades,
-                },
-                f,
-                indent=2,
-                ensure_ascii=False,
-                default=str,  # datetime 직렬화
-            )
+        _dump_json(
+            {
+                "ticker": args.ticker,
+                "start_date": args.start_date,
+                "end_date": args.end_date,
+                "seed": args.seed,
+                "summary": metrics,
+                "trades": result.trades,
+            },
+            json_path,
+        )
         print(f"\nSaved full results: {json_path}")
 
         # 2. CSV 저장(메트릭 요약)
         csv_path = output_dir / f"{prefix}_metrics.csv"
-        flat_metrics = {k: v for k, v in metrics.items() if not isinstance(v, (dict, list))}
+        flat_items = [(k, v) for k, v in metrics.items() if not isinstance(v, (dict, list))]
         with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=flat_metrics.keys())
-            writer.writeheader()
-            writer.writerow(flat_metrics)
+            # 헤더/값 한 줄씩이므로 DictWriter의 키 매핑 없이 바로 기록
+            writer = csv.writer(f)
+            writer.writerow([k for k, _ in flat_items])
+            writer.writerow([v for _, v in flat_items])
         print(f"Saved metrics CSV: {csv_path}")
 
         # 3. 거래 이력 CSV
         if result.trades:
             trades_csv_path = output_dir / f"{prefix}_trades.csv"
             with open(trades_csv_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=result.trades[0].keys())
-                writer.writeheader()
-                writer.writerows(result.trades)
+                writer = csv.writer(f)
+                writer.writerow(TRADE_FIELDS)
+                writer.writerows(map(_trade_row, result.trades))
             print(f"Saved trades CSV: {trades_csv_path}")
 
         print("\n" + "=" * 80)
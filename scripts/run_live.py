@@ -26,22 +26,24 @@ logging.getLogger('finmem').setLevel(logging.CRITICAL)
 logging.getLogger('services.loader').setLevel(logging.CRITICAL)
 
 from config import settings
-from services.simulation import SimulationService
-from services.backtest import BacktestService
 
 
-async def main():
-    parser = argparse.ArgumentParser(description="실시간 거래 추천")
-    parser.add_argument("--ticker", type=str, required=True, help="티커 심볼 (예: AAPL)")
-    parser.add_argument("--window", type=int, default=30, help="슬라이딩 윈도우 길이 (기본: 30)")
-    parser.add_argument("--interval", type=str, default="1h", help="시간 간격 (예: 1h, 1day)")
-    parser.add_argument("--seed", type=int, default=None, help="랜덤 시드")
-    parser.add_argument("--use-memory", action="store_true", default=False, help="메모리 학습 사용")
-    parser.add_argument("--no-memory", action="store_true", default=False, help="메모리 학습 미사용")
-    parser.add_argument("--capital", type=float, default=10000.0, help="초기 자본 (기본: $10,000)")
+parser = argparse.ArgumentParser(description="실시간 거래 추천")
+parser.add_argument("--ticker", type=str, required=True, help="티커 심볼 (예: AAPL)")
+parser.add_argument("--window", type=int, default=30, help="슬라이딩 윈도우 길이 (기본: 30)")
+parser.add_argument("--interval", type=str, default="1h", help="시간 간격 (예: 1h, 1day)")
+parser.add_argument("--seed", type=int, default=None, help="랜덤 시드")
+parser.add_argument("--use-memory", action="store_true", default=False, help="메모리 학습 사용")
+parser.add_argument("--no-memory", action="store_true", default=False, help="메모리 학습 미사용")
+parser.add_argument("--capital", type=float, default=10000.0, help="초기 자본 (기본: $10,000)")
+
 
+async def main():
     args = parser.parse_args()
 
+    from services.backtest import BacktestService
+    from services.simulation import SimulationService
+
     # 메모리 사용 여부 결정
     use_memory = args.use_memory or not args.no_memory
 
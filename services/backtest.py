@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+import numpy as np
 import pandas as pd
 import time
 import timeit
@@ -44,8 +46,11 @@ class BacktestService:
             prices = await loader.fetch_prices(
                 ticker, window=window, mode="intraday", interval=interval, start_date=None, end_date=target_datetime
             )
-            prices = loader.add_indicators(prices)
-            prices = prices.sort_index()
+            # 지표 계산(pandas rolling/ewm)은 CPU 작업이므로 이벤트 루프 밖에서 수행
+            prices = await asyncio.to_thread(loader.add_indicators, prices)
+            # 로더가 이미 정렬된 인덱스를 돌려주므로 단조 증가가 아닐 때만 정렬 (불필요한 복사 방지)
+            if not prices.index.is_monotonic_increasing:
+                prices = prices.sort_index()
             if prices.empty:
                 raise ValueError("no price data returned for target_datetime")
             latest = prices.tail(1).to_dict(orient="records")[0]
@@ -119,8 +124,10 @@ class BacktestService:
                 start_date=fetch_start,
                 end_date=end_date,
             )
-            prices = loader.add_indicators(prices)
-            prices = prices.sort_index()
+            prices = await asyncio.to_thread(loader.add_indicators, prices)
+            # 로더가 이미 정렬된 인덱스를 돌려주므로 단조 증가가 아닐 때만 정렬 (불필요한 복사 방지)
+            if not prices.index.is_monotonic_increasing:
+                prices = prices.sort_index()
             if prices.empty:
                 raise ValueError("no price data returned for backtest")
             closes = prices["close"]
@@ -129,14 +136,11 @@ class BacktestService:
             first_trade_idx = 0
             if actual_start_date:
                 start_ts = pd.to_datetime(actual_start_date)
-                # start_date 이후의 첫 데이터 인덱스 찾기
-                valid_mask = prices.index >= start_ts
-                if valid_mask.sum() == 0:
+                # start_date 이후의 첫 데이터 인덱스 찾기 (정렬된 인덱스에서 이진 탐색)
+                first_trade_idx = int(prices.index.searchsorted(start_ts, side="left"))
+                if first_trade_idx >= len(prices):
                     raise ValueError(f"지정한 시작일({actual_start_date}) 이후 데이터가 없습니다.")
 
-                first_valid_idx = prices.index[valid_mask][0]
-                first_trade_idx = prices.index.get_loc(first_valid_idx)
-
                 # 윈도우 확보 확인
                 if first_trade_idx < window:
                     raise ValueError(
@@ -175,9 +179,20 @@ class BacktestService:
                     f"과거 날짜로 기간을 설정해주세요."
                 )
 
+            # 루프 내 반복 속성 조회를 지역 변수로 고정 (LOAD_FAST)
+            run_on_snapshot = self.sim_service.run_on_snapshot
+            memory_store_manager_only = self.settings.memory_store_manager_only
+            append_return = returns.append
+            append_trade = trades.append
+
+            # 스텝마다 DataFrame을 슬라이스/변환하지 않도록 행 레코드·종가 배열·인덱스를 한 번만 추출
+            records = prices.to_dict(orient="records")
+            close_arr = closes.to_numpy()
+            index = prices.index
+
             for step_idx, idx in enumerate(range(first_trade_idx, len(prices), step), 1):
-                slice_df = prices.iloc[: idx + 1]
-                latest = slice_df.tail(1).to_dict(orient="records")[0]
+                latest = records[idx]
+                ts = index[idx]
                 snapshot = {
                     "ticker": ticker,
                     "window": window,
@@ -194,12 +209,12 @@ class BacktestService:
                         "initial_capital": float(initial_capital),
                     },
                 }
-                sim_result = await self.sim_service.run_on_snapshot(
+                sim_result = await run_on_snapshot(
                     snapshot=snapshot,
                     ticker=ticker,
                     include_news=include_news,
                     bb_rounds=None,
-                    memory_store_manager_only=self.settings.memory_store_manager_only,
+                    memory_store_manager_only=memory_store_manager_only,
                     seed=seed,
                     use_memory=use_memory,
                     mode="intraday",
@@ -215,7 +230,7 @@ class BacktestService:
                 memories_info = sim_result.summary.get("memories", {})
 
                 price = latest.get("close", 0.0)
-                prev_price = closes.iloc[idx - 1] if idx > 0 else price
+                prev_price = close_arr[idx - 1] if idx > 0 else price
                 prev_equity = cash + position * prev_price
 
                 # stop-loss / take-profit check
@@ -289,11 +304,11 @@ class BacktestService:
 
                 step_pnl = equity - prev_equity
                 step_return = step_pnl / float(prev_equity if prev_equity else 1.0)
-                returns.append(step_return)
+                append_return(step_return)
 
                 # 거래 정보 기록
                 trade_info = {
-                    "ts": slice_df.index[-1].to_pydatetime(),
+                    "ts": ts.to_pydatetime(),
                     "action": action,
                     "price": float(price),
                     "trade_shares": float(delta),
@@ -311,7 +326,7 @@ class BacktestService:
                         "working": memories_info.get("working", []),
                     },
                 }
-                trades.append(trade_info)
+                append_trade(trade_info)
 
                 # 진행률 출력 (항상)
                 print(f"PROGRESS: {step_idx}/{total_steps}", flush=True)
@@ -319,13 +334,14 @@ class BacktestService:
                 # 거래 발생 시 실시간 로그 출력
                 if delta != 0:  # 실제 거래가 발생한 경우만
                     trade_type = "매수" if delta > 0 else "매도"
-                    print(f"[거래 #{len(trades):3d}] {slice_df.index[-1].strftime('%Y-%m-%d %H:%M')} | "
+                    print(f"[거래 #{len(trades):3d}] {ts.strftime('%Y-%m-%d %H:%M')} | "
                           f"{trade_type:2s} {abs(delta):6.2f}주 @ ${price:7.2f} | "
                           f"포지션: {position:6.2f}주 | "
                           f"수익: ${step_pnl:+8.2f} | "
                           f"잔고: ${equity:,.2f}", flush=True)
 
-            summary = self._summarize(
+            summary = await asyncio.to_thread(
+                self._summarize,
                 ticker=ticker,
                 window=window,
                 interval=interval,
@@ -390,9 +406,10 @@ class BacktestService:
         end_ts,
     ) -> Dict[str, Any]:
         if returns:
-            ret_series = pd.Series(returns)
-            vol = float(ret_series.std(ddof=0))
-            mean_ret = float(ret_series.mean())
+            # pd.Series 생성 없이 ndarray에서 바로 모멘트 계산 (ddof=0 유지)
+            ret_arr = np.asarray(returns, dtype=float)
+            vol = float(ret_arr.std())
+            mean_ret = float(ret_arr.mean())
             sharpe = float(mean_ret / vol * (len(returns) ** 0.5)) if vol > 0 else 0.0
         else:
             vol = 0.0
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 from datetime import datetime, date
 
 from bs4 import BeautifulSoup
@@ -14,8 +16,9 @@ from config import Settings
 
 
 class MarketDataLoader:
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, http_client: Optional[httpx.AsyncClient] = None):
         self.settings = settings
+        self._http = http_client  # 앱 단위 공유 클라이언트 (없으면 호출마다 생성)
         self.price_url_intraday = str(settings.price_endpoint_intraday or settings.price_endpoint)
         self.price_url_daily = str(settings.price_endpoint_daily or settings.price_endpoint)
         self.news_url = str(settings.news_endpoint)
@@ -58,7 +61,7 @@ class MarketDataLoader:
             page_size = max(page_size, window)
             page = 1
             last_page_first_date = None
-            async with httpx.AsyncClient(timeout=10) as client:
+            async with self._client() as client:
                 while page <= max_pages:
                     params: Dict[str, Any] = {
                         "symbol": ticker,
@@ -72,7 +75,7 @@ class MarketDataLoader:
                     if end_date:
                         params["end_date"] = self._to_iso8601(end_date)
 
-                    resp = await client.get(url, headers=headers, params=params)
+                    resp = await client.get(url, headers=headers, params=params, timeout=10)
                     if resp.status_code >= 400:
                         raise httpx.HTTPStatusError(f"HTTP {resp.status_code}: {resp.text}", request=resp.request, response=resp)
                     payload = resp.json()
@@ -148,8 +151,8 @@ class MarketDataLoader:
         ]
         for url in urls:
             try:
-                async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
-                    resp = await client.get(url, headers=headers)
+                async with self._client() as client:
+                    resp = await client.get(url, headers=headers, timeout=10, follow_redirects=True)
                     if resp.status_code >= 400:
                         raise httpx.HTTPStatusError(f"HTTP {resp.status_code}: {resp.text}", request=resp.request, response=resp)
                     feed = feedparser.parse(resp.text)
@@ -179,6 +182,17 @@ class MarketDataLoader:
         self._set_cached_news(ticker, limit, page, stub)
         return stub
 
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        공유 클라이언트가 주입되었으면 재사용(keep-alive)하고, 아니면 호출 단위로 생성/종료합니다.
+        """
+        if self._http is not None:
+            yield self._http
+            return
+        async with httpx.AsyncClient() as client:
+            yield client
+
     def _get_cached_news(self, ticker: str, limit: int, page: int) -> Optional[list[dict[str, Any]]]:
         key = (ticker, limit, page)
         item = self._news_cache.get(key)
@@ -262,7 +276,7 @@ class MarketDataLoader:
             start_date=start_date,
             end_date=end_date,
         )
-        enriched = self.add_indicators(prices)
+        enriched = await asyncio.to_thread(self.add_indicators, prices)
         latest_raw = enriched.tail(1).to_dict(orient="records")[0]
         latest = self._normalize_record(latest_raw)
         news = await self.fetch_news(ticker, limit=news_limit, page=news_page)
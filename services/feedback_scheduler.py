@@ -4,13 +4,15 @@ import asyncio
 import timeit
 from typing import Optional
 
+import httpx
+
 from config import Settings
 from services.simulation import SimulationService
 from services.metrics import metrics_tracker
 
 
-async def _feedback_loop(settings: Settings, interval_seconds: int) -> None:
-    service = SimulationService(settings)
+async def _feedback_loop(settings: Settings, interval_seconds: int, http_client: Optional[httpx.AsyncClient]) -> None:
+    service = SimulationService(settings, http_client=http_client)
     while True:
         t0 = timeit.default_timer()
         try:
@@ -23,12 +25,14 @@ async def _feedback_loop(settings: Settings, interval_seconds: int) -> None:
         await asyncio.sleep(interval_seconds)
 
 
-def start_feedback_scheduler(settings: Settings, interval_seconds: int = 300) -> Optional[asyncio.Task]:
+def start_feedback_scheduler(
+    settings: Settings, interval_seconds: int = 300, http_client: Optional[httpx.AsyncClient] = None
+) -> Optional[asyncio.Task]:
     """
     Start background feedback checker. Returns the asyncio.Task so the caller can cancel on shutdown.
     """
     try:
         loop = asyncio.get_event_loop()
-        return loop.create_task(_feedback_loop(settings, interval_seconds))
+        return loop.create_task(_feedback_loop(settings, interval_seconds, http_client))
     except Exception:
         return None
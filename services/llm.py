@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from array import array
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
@@ -77,11 +79,17 @@ class OllamaEmbeddingClient(BaseEmbeddingClient):
         self,
         model_name: str = "nomic-embed-text",
         base_url: str = "http://localhost:11434",
+        query_cache_size: int = 256,
+        query_cache_max_chars: int = 256,
     ):
         import ollama
 
         self.client = ollama.Client(host=base_url)
         self.model_name = model_name
+        # 같은 검색 쿼리(예: "manager report", "{ticker} market")가 스텝마다 반복되므로 인스턴스(=모델)별로 메모이즈.
+        # 중복 검사용 리포트 전문 등 긴 텍스트는 다시 나오지 않으므로 캐시하지 않음
+        self.query_cache_max_chars = query_cache_max_chars
+        self._embed_query_cached = lru_cache(maxsize=query_cache_size)(self._embed_query_uncached)
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """여러 텍스트를 임베딩"""
@@ -99,12 +107,18 @@ class OllamaEmbeddingClient(BaseEmbeddingClient):
         return embeddings
 
     def embed_query(self, text: str) -> list[float]:
-        """단일 쿼리를 임베딩"""
+        """단일 쿼리를 임베딩 (짧은 쿼리는 캐시된 벡터 재사용)"""
+        if len(text) > self.query_cache_max_chars:
+            return list(self._embed_query_uncached(text))
+        return self._embed_query_cached(text).tolist()
+
+    def _embed_query_uncached(self, text: str) -> array:
+        # 캐시에는 float 객체 tuple(768차원 ≈ 25KB) 대신 double 배열(≈ 6KB)로 보관, 반환 시 새 리스트로 복사
         response = self.client.embeddings(
             model=self.model_name,
             prompt=text
         )
-        return response.get("embedding", [])
+        return array("d", response.get("embedding", []))
 
 
 def build_embeddings(
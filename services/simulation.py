@@ -5,22 +5,34 @@ import json
 import time
 import logging
 import timeit
+from functools import lru_cache
 from typing import Any, Dict, Optional, List
 from uuid import uuid4
 
+import httpx
+
 from config import Settings
 from agents.graph import TradeState
 from agents import prompts
 from memory.finmem_memory import FinMemMemory
 from memory.redis_store import build_vector_store
 from services.data_loader import MarketDataLoader
-from services.llm import build_embeddings, build_llm
+from services.llm import BaseEmbeddingClient, build_embeddings, build_llm
 from services.metrics import metrics_tracker
 from db.session import SessionLocal
 from db.models import AgentLog, Simulation
 from services.feedback import FeedbackService
 
 
+@lru_cache(maxsize=None)
+def _shared_embeddings(model_name: str, base_url: str) -> BaseEmbeddingClient:
+    """
+    같은 프로세스의 SimulationService들이 임베딩 클라이언트를 공유 (요청마다 서비스를 만들어도
+    HTTP 연결과 쿼리 임베딩 캐시가 유지됨). 벡터 스토어는 인덱스 재생성을 보장하기 위해 공유하지 않음.
+    """
+    return build_embeddings(model_name=model_name, base_url=base_url)
+
+
 @dataclass
 class SimulationResult:
     simulation_id: str
@@ -29,9 +41,9 @@ class SimulationResult:
 
 
 class SimulationService:
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, http_client: Optional[httpx.AsyncClient] = None):
         self.settings = settings
-        self.loader = MarketDataLoader(settings)
+        self.loader = MarketDataLoader(settings, http_client=http_client)
         self.llm = build_llm(
             model_name=settings.ollama_model,
             temperature=settings.llm_temperature,
@@ -110,10 +122,7 @@ class SimulationService:
 
     def _build_memory(self) -> FinMemMemory:
         try:
-            embeddings = build_embeddings(
-                model_name=self.settings.ollama_embedding_model,
-                base_url=self.settings.ollama_base_url,
-            )
+            embeddings = _shared_embeddings(self.settings.ollama_embedding_model, self.settings.ollama_base_url)
             store = build_vector_store(self.settings, embeddings)
             return FinMemMemory(
                 store,
@@ -130,6 +139,8 @@ class SimulationService:
                 skip_stub=self.settings.memory_skip_stub,
                 is_stub_embedding=False,  # Ollama 사용하므로 항상 False
                 gc_batch=self.settings.memory_gc_batch,
+                query_cache_size=self.settings.memory_query_cache_size,
+                query_cache_ttl=self.settings.memory_query_cache_ttl,
                 expected_dim=self.settings.redis_vector_dim,
                 logger=logging.getLogger("finmem"),
             )
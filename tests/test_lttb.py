@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from cli.visualization import _lttb_indices
+
+
+def _series(n):
+    rng = np.random.default_rng(0)
+    x = np.arange(n, dtype=float)
+    y = np.cumsum(rng.normal(size=n))
+    return x, y
+
+
+@pytest.mark.parametrize("n, n_out", [(10, 10), (10, 50)])
+def test_lttb_returns_every_index_when_not_downsampling(n, n_out):
+    x, y = _series(n)
+    assert _lttb_indices(x, y, n_out).tolist() == list(range(n))
+
+
+@pytest.mark.parametrize("n, n_out", [(5, 4), (6, 5), (100, 3), (1000, 37), (10_000, 5000)])
+def test_lttb_output_shape_and_order(n, n_out):
+    x, y = _series(n)
+    idx = _lttb_indices(x, y, n_out)
+    assert len(idx) == n_out
+    assert np.all(np.diff(idx) > 0)
+    assert idx[0] == 0
+    assert idx[-1] == n - 1
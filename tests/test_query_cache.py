@@ -0,0 +1,32 @@
+from memory import query_cache
+from memory.query_cache import QueryCache
+
+
+def test_query_cache_expires_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+    cache = QueryCache(max_size=10, ttl=5.0)
+    cache.set("q", [1])
+    now[0] += 4.9
+    assert cache.get("q") == [1]
+    now[0] += 0.2
+    assert cache.get("q") is None
+    assert len(cache) == 0
+
+
+def test_query_cache_evicts_least_recently_used():
+    cache = QueryCache(max_size=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_query_cache_size_zero_disables_caching():
+    cache = QueryCache(max_size=0, ttl=60.0)
+    cache.set("q", [1])
+    assert cache.get("q") is None
+    assert len(cache) == 0